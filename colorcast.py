@@ -14,31 +14,56 @@ Features:
 - Optimized performance with smart caching and debounced slider updates
 - Interactive GUI with image preview and save functionality
 
-Dependencies: numpy, scikit-image, scipy, PyQt5
+Dependencies: numpy, scikit-image, scipy, numba, PyQt5 (optional: opencv-python for faster resizing)
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from skimage import io, img_as_float, exposure, transform
+from numba import njit, prange
+from skimage import io, img_as_float32, transform
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtWidgets import QFileDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout, QWidget, QApplication, QSlider, QComboBox
 from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+
+def _fast_resize(img, target_shape):
+    """Resize an RGB image to target_shape (H, W), using OpenCV when it is installed."""
+    h, w = target_shape[:2]
+    if cv2 is None:
+        return transform.resize(img, (h, w) + img.shape[2:], anti_aliasing=True, preserve_range=True).astype(np.float32, copy=False)
+    
+    # INTER_AREA averages pixels when shrinking; INTER_CUBIC can overshoot, so clip it back to [0, 1]
+    if h * w < img.shape[0] * img.shape[1]:
+        return cv2.resize(np.ascontiguousarray(img, dtype=np.float32), (w, h), interpolation=cv2.INTER_AREA)
+    resized = cv2.resize(np.ascontiguousarray(img, dtype=np.float32), (w, h), interpolation=cv2.INTER_CUBIC)
+    return np.clip(resized, 0, 1, out=resized)
+
+# Rec. 601 luma weights for R, G, B
+_LUM_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
 
 def load_image(path):
+    """Load an image as float32 RGB; also return its shape as stored on disk."""
     try:
-        img = img_as_float(io.imread(path))
-        return ensure_rgb(img)
+        img = img_as_float32(io.imread(path))
+        return ensure_rgb(img), img.shape
     except Exception as e:
         raise ValueError(f"Could not load image from {path}: {str(e)}")
 
 def ensure_rgb(img):
-    """Convert image to RGB format, handling grayscale and RGBA images."""
+    """Convert image to RGB format, handling grayscale and RGBA images.
+    
+    Grayscale input is returned as a read-only broadcast view rather than a copy.
+    """
     if img.ndim == 2:
-        return np.stack([img, img, img], axis=2)
+        return np.broadcast_to(img[:, :, None], img.shape + (3,))
     elif img.ndim == 3:
         if img.shape[2] == 1:
-            return np.concatenate([img, img, img], axis=2)
+            return np.broadcast_to(img, img.shape[:2] + (3,))
         elif img.shape[2] == 3:
             return img
         elif img.shape[2] == 4:
@@ -48,122 +73,321 @@ def ensure_rgb(img):
     else:
         raise ValueError(f"Unsupported image dimensions: {img.ndim}")
 
-def match_histograms_multichannel(source, reference):
-    if source.shape != reference.shape:
+def _quantize_u8(img):
+    """Quantize a [0, 1] float image to 8-bit levels."""
+    return (np.clip(img, 0, 1) * 255 + 0.5).astype(np.uint8)
+
+@njit(cache=True)
+def _hist_rgb_u8(img_u8, out_hist):
+    """Fill out_hist (C, 256) with the per-channel histograms of an interleaved uint8 image.
+    
+    Four pixels are handled per step, each counted into its own private sub-histogram, so
+    runs of equal neighbouring values don't serialize on a single counter. The
+    sub-histograms are summed at the end.
+    """
+    h, w, ch = img_u8.shape
+    sub = np.zeros((4, ch, 256), np.int64)
+    for y in range(h):
+        x = 0
+        while x + 4 <= w:
+            for c in range(ch):
+                sub[0, c, img_u8[y, x, c]] += 1
+                sub[1, c, img_u8[y, x + 1, c]] += 1
+                sub[2, c, img_u8[y, x + 2, c]] += 1
+                sub[3, c, img_u8[y, x + 3, c]] += 1
+            x += 4
+        while x < w:
+            for c in range(ch):
+                sub[0, c, img_u8[y, x, c]] += 1
+            x += 1
+    
+    for c in range(ch):
+        for b in range(256):
+            out_hist[c, b] = sub[0, c, b] + sub[1, c, b] + sub[2, c, b] + sub[3, c, b]
+
+def _build_cdfs(img_u8):
+    """Return the normalized per-channel 256-bin CDFs of an 8-bit image, shape (C, 256)."""
+    hist = np.empty((img_u8.shape[2], 256), dtype=np.int64)
+    _hist_rgb_u8(img_u8, hist)
+    return np.cumsum(hist, axis=1) / (img_u8.shape[0] * img_u8.shape[1])
+
+def _precompute_style_lut(style):
+    """Return the per-channel 256-bin CDFs of a style image, shape (3, 256)."""
+    return _build_cdfs(_quantize_u8(style))
+
+def _matching_lut(source_cdf, reference_cdf, dtype):
+    """Build the 256-entry LUT that maps source levels onto the reference distribution."""
+    levels = np.minimum(np.searchsorted(reference_cdf, source_cdf), 255)
+    return levels.astype(dtype) / dtype.type(255)
+
+def _match_channel(src_ch, ref_ch, out):
+    """Histogram-match one channel into out by mapping source quantiles onto the reference CDF.
+    
+    Pixels sharing a source value all receive one output, interpolated between the
+    reference's unique values the same way exposure.match_histograms does.
+    """
+    _, src_indices, src_counts = np.unique(src_ch, return_inverse=True, return_counts=True)
+    ref_values, ref_counts = np.unique(ref_ch, return_counts=True)
+    src_quantiles = np.cumsum(src_counts) / src_ch.size
+    ref_quantiles = np.cumsum(ref_counts) / ref_ch.size
+    matched_values = np.interp(src_quantiles, ref_quantiles, ref_values)
+    # mode='clip' lets take write straight into a strided out without buffering
+    np.take(matched_values.astype(out.dtype, copy=False), src_indices.ravel(), out=out, mode='clip')
+
+_CHANNEL_POOL = ThreadPoolExecutor(max_workers=3)
+
+def _match_channels(source, reference, reference_cdfs=None, out=None):
+    """Histogram-match every channel of source into out, reusing cached reference CDFs when given."""
+    out = np.empty(source.shape, source.dtype) if out is None else out
+    if reference_cdfs is None and source.shape == reference.shape:
+        # Equal pixel counts: match each channel against the reference's own CDF
+        src = source.reshape(-1, 3)
+        ref = reference.reshape(-1, 3)
+        # out is C-contiguous, so this reshape is a view and each channel lands in place
+        out_flat = out.reshape(-1, 3)
+        
+        def match(i):
+            _match_channel(src[:, i], ref[:, i], out_flat[:, i])
+    else:
+        if reference_cdfs is None:
+            reference_cdfs = _precompute_style_lut(reference)
+        
+        # Counting-sort path: histogram the quantized source and remap it through a 256-entry LUT
+        source_q = _quantize_u8(source)
+        source_cdfs = _build_cdfs(source_q)
+        
+        def match(i):
+            lut = _matching_lut(source_cdfs[i], reference_cdfs[i], out.dtype)
+            out[:,:,i] = lut[source_q[:,:,i]]
+    
+    # Channels are independent and NumPy releases the GIL while sorting and indexing
+    for future in [_CHANNEL_POOL.submit(match, i) for i in range(3)]:
+        future.result()
+    return out
+
+def match_histograms_multichannel(source, reference, reference_cdfs=None, out=None):
+    if reference_cdfs is None and source.shape != reference.shape:
         print(f"Resizing style image from {reference.shape} to {source.shape}")
-        reference = transform.resize(reference, source.shape, anti_aliasing=True, preserve_range=True)
+        reference = _fast_resize(reference, source.shape[:2])
     
     if source.ndim != 3 or source.shape[2] != 3:
         raise ValueError("Source image is not 3-channel RGB after preprocessing.")
     if reference.ndim != 3 or reference.shape[2] != 3:
         raise ValueError("Reference image is not 3-channel RGB after preprocessing.")
     
-    matched = np.empty_like(source)
-    for i in range(3):
-        matched[:,:,i] = exposure.match_histograms(source[:,:,i], reference[:,:,i])
-    return matched
+    return _match_channels(source, reference, reference_cdfs, out)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _meanstd_kernel(src, ref, out):
+    """Fused mean/std transfer: one pass for the statistics, one pass for the clipped output."""
+    h, w, ch = src.shape
+    n = h * w
+    # Per-row partial sums act as thread-local accumulators: [src sum, src sq, ref sum, ref sq]
+    partial = np.zeros((h, 4, ch))
+    for y in prange(h):
+        for x in range(w):
+            for c in range(ch):
+                sv = src[y, x, c]
+                rv = ref[y, x, c]
+                partial[y, 0, c] += sv
+                partial[y, 1, c] += sv * sv
+                partial[y, 2, c] += rv
+                partial[y, 3, c] += rv * rv
+    
+    totals = partial.sum(axis=0)
+    offset = np.empty(ch)
+    scale = np.empty(ch)
+    ref_mean = np.empty(ch)
+    for c in range(ch):
+        source_mean = totals[0, c] / n
+        source_std = np.sqrt(max(totals[1, c] / n - source_mean * source_mean, 0.0))
+        ref_mean[c] = totals[2, c] / n
+        ref_std = np.sqrt(max(totals[3, c] / n - ref_mean[c] * ref_mean[c], 0.0))
+        offset[c] = source_mean
+        scale[c] = ref_std / (source_std + 1e-8)
+    
+    for y in prange(h):
+        for x in range(w):
+            for c in range(ch):
+                v = (src[y, x, c] - offset[c]) * scale[c] + ref_mean[c]
+                out[y, x, c] = min(max(v, 0.0), 1.0)
 
-def color_transfer_meanstd(source, reference):
+def color_transfer_meanstd(source, reference, out=None):
     """Transfer color using mean and standard deviation matching per channel."""
     if source.shape != reference.shape:
         print(f"Resizing style image from {reference.shape} to {source.shape}")
-        reference = transform.resize(reference, source.shape, anti_aliasing=True, preserve_range=True)
+        reference = _fast_resize(reference, source.shape[:2])
     
     if source.ndim != 3 or source.shape[2] != 3:
         raise ValueError("Source image is not 3-channel RGB after preprocessing.")
     if reference.ndim != 3 or reference.shape[2] != 3:
         raise ValueError("Reference image is not 3-channel RGB after preprocessing.")
     
-    result = np.empty_like(source)
-    for i in range(3):
-        source_mean = np.mean(source[:,:,i])
-        source_std = np.std(source[:,:,i])
-        ref_mean = np.mean(reference[:,:,i])
-        ref_std = np.std(reference[:,:,i])
-        
-        result[:,:,i] = ((source[:,:,i] - source_mean) * (ref_std / (source_std + 1e-8))) + ref_mean
+    out = np.empty(source.shape, source.dtype) if out is None else out
+    _meanstd_kernel(source, reference, out)
+    return out
+
+@njit(parallel=True, cache=True)
+def _to_u8(src, dst):
+    """Clip to [0, 1], scale and round into a uint8 buffer in a single pass."""
+    h, w, ch = src.shape
+    for y in prange(h):
+        for x in range(w):
+            for c in range(ch):
+                v = min(max(src[y, x, c], 0.0), 1.0)
+                dst[y, x, c] = np.uint8(v * 255.0 + 0.5)
+
+@njit(cache=True)
+def _to_u8_serial(src, dst):
+    """Single-threaded `_to_u8` for the display worker.
     
-    return np.clip(result, 0, 1)
+    Parallel kernels must only run on the GUI thread: Numba's fallback workqueue
+    threading layer aborts if two threads enter it at once.
+    """
+    h, w, ch = src.shape
+    for y in range(h):
+        for x in range(w):
+            for c in range(ch):
+                v = min(max(src[y, x, c], 0.0), 1.0)
+                dst[y, x, c] = np.uint8(v * 255.0 + 0.5)
+
+# Compile the kernels at import so the first transfer in the GUI doesn't stall
+_meanstd_kernel(np.zeros((2, 2, 3), np.float32), np.zeros((2, 2, 3), np.float32), np.empty((2, 2, 3), np.float32))
+_to_u8(np.zeros((2, 2, 3), np.float32), np.empty((2, 2, 3), np.uint8))
+_to_u8_serial(np.zeros((2, 2, 3), np.float32), np.empty((2, 2, 3), np.uint8))
+_hist_rgb_u8(np.zeros((2, 2, 3), np.uint8), np.empty((3, 256), np.int64))
 
 def apply_curve(values, curve_type='linear'):
     """Apply tone curve to values."""
     if curve_type == 'linear':
         return values
     elif curve_type == 's-curve':
-        return 0.5 + 0.5 * np.sin(np.pi * (values - 0.5))
+        half = np.float32(0.5)
+        return half + half * np.sin(np.float32(np.pi) * (values - half))
     elif curve_type == 'contrast':
-        return np.power(values, 0.8)
+        return np.power(values, np.float32(0.8))
     return values
 
-def lut_transfer_with_curve(source, reference, curve_type='linear'):
+def lut_transfer_with_curve(source, reference, curve_type='linear', reference_cdfs=None, out=None):
     """LUT-based transfer with curve adjustment."""
-    if source.shape != reference.shape:
+    if reference_cdfs is None and source.shape != reference.shape:
         print(f"Resizing style image from {reference.shape} to {source.shape}")
-        reference = transform.resize(reference, source.shape, anti_aliasing=True, preserve_range=True)
+        reference = _fast_resize(reference, source.shape[:2])
     
     if source.ndim != 3 or source.shape[2] != 3:
         raise ValueError("Source image is not 3-channel RGB after preprocessing.")
     if reference.ndim != 3 or reference.shape[2] != 3:
         raise ValueError("Reference image is not 3-channel RGB after preprocessing.")
     
-    matched = np.empty_like(source)
-    for i in range(3):
-        matched[:,:,i] = exposure.match_histograms(source[:,:,i], reference[:,:,i])
-        matched[:,:,i] = apply_curve(matched[:,:,i], curve_type)
+    matched = _match_channels(source, reference, reference_cdfs, out)
+    # The linear curve (and any unknown curve type) is the identity, so skip it entirely
+    if curve_type in ('s-curve', 'contrast'):
+        matched[...] = apply_curve(matched, curve_type)
     
-    return np.clip(matched, 0, 1)
+    return np.clip(matched, 0, 1, out=matched)
 
-def selective_color_transfer(source, reference, mode='full', shadow_threshold=0.3, highlight_threshold=0.7):
+def selective_color_transfer(source, reference, mode='full', shadow_threshold=0.3, highlight_threshold=0.7, reference_cdfs=None, out=None):
     """Transfer colors selectively based on luminance regions."""
-    if source.shape != reference.shape:
+    if reference_cdfs is None and source.shape != reference.shape:
         print(f"Resizing style image from {reference.shape} to {source.shape}")
-        reference = transform.resize(reference, source.shape, anti_aliasing=True, preserve_range=True)
+        reference = _fast_resize(reference, source.shape[:2])
     
     if source.ndim != 3 or source.shape[2] != 3:
         raise ValueError("Source image is not 3-channel RGB after preprocessing.")
     if reference.ndim != 3 or reference.shape[2] != 3:
         raise ValueError("Reference image is not 3-channel RGB after preprocessing.")
     
-    source_lum = 0.299 * source[:,:,0] + 0.587 * source[:,:,1] + 0.114 * source[:,:,2]
+    matched = _match_channels(source, reference, reference_cdfs, out)
+    if mode not in ('shadows', 'midtones', 'highlights'):
+        return np.clip(matched, 0, 1, out=matched)
     
-    if mode == 'full':
-        mask = np.ones_like(source_lum)
-    elif mode == 'shadows':
-        mask = (source_lum < shadow_threshold).astype(float)
+    source_lum = source @ _LUM_WEIGHTS.astype(source.dtype, copy=False)
+    
+    if mode == 'shadows':
+        mask = source_lum < shadow_threshold
     elif mode == 'midtones':
-        mask = ((source_lum >= shadow_threshold) & (source_lum <= highlight_threshold)).astype(float)
-    elif mode == 'highlights':
-        mask = (source_lum > highlight_threshold).astype(float)
+        mask = (source_lum >= shadow_threshold) & (source_lum <= highlight_threshold)
     else:
-        mask = np.ones_like(source_lum)
-    
-    mask = np.stack([mask, mask, mask], axis=2)
+        mask = source_lum > highlight_threshold
     
-    matched = np.empty_like(source)
-    for i in range(3):
-        matched[:,:,i] = exposure.match_histograms(source[:,:,i], reference[:,:,i])
-    
-    result = source * (1 - mask) + matched * mask
-    return np.clip(result, 0, 1)
+    # Select per pixel with the (H, W, 1) boolean mask, restoring the source outside it in place
+    np.copyto(matched, source, where=~mask[:, :, None])
+    return np.clip(matched, 0, 1, out=matched)
+
+def downscale_for_preview(img, max_size):
+    """Shrink img so its long edge is at most max_size pixels; smaller images are returned as-is."""
+    scale = max_size / max(img.shape[:2])
+    if scale >= 1.0:
+        return img
+    h, w = img.shape[:2]
+    return _fast_resize(img, (max(1, round(h * scale)), max(1, round(w * scale))))
 
 def apply_lut_transfer(content, style, intensity=1.0):
     matched = match_histograms_multichannel(content, style)
     return blend_images(content, matched, intensity)
 
-def blend_images(original, styled, intensity):
-    """Blend original and styled images based on intensity (0.0 to 1.0)."""
-    intensity = np.clip(intensity, 0.0, 1.0)
-    return original * (1 - intensity) + styled * intensity
+def blend_images(original, styled, intensity, out=None):
+    """Blend original and styled images based on intensity (0.0 to 1.0).
+    
+    Computed as original + (styled - original) * intensity, in place in `out` when given.
+    """
+    intensity = np.float32(np.clip(intensity, 0.0, 1.0))
+    if out is None:
+        out = np.empty(original.shape, dtype=np.result_type(original, styled))
+    np.subtract(styled, original, out=out)
+    np.multiply(out, intensity, out=out)
+    np.add(out, original, out=out)
+    return out
+
+class _DisplaySignals(QObject):
+    finished = pyqtSignal(object, int, QImage)
+
+class _DisplayWorker(QRunnable):
+    """Convert a float image into a scaled QImage for `label` off the GUI thread."""
+    def __init__(self, img_array, buf, image_format, label, token, latest_tokens, signals):
+        super().__init__()
+        self.img_array = img_array
+        self.buf = buf
+        self.image_format = image_format
+        self.label = label
+        self.token = token
+        self.latest_tokens = latest_tokens
+        self.signals = signals
+
+    def run(self):
+        # A newer image for this label was queued while we waited; skip the stale one
+        if self.latest_tokens.get(self.label) != self.token:
+            return
+        _to_u8_serial(self.img_array, self.buf)
+        h, w, ch = self.buf.shape
+        qt_image = QImage(self.buf.data, w, h, ch * w, self.image_format)
+        # scaled() returns a copy, so the buffer can be reused as soon as this returns
+        self.signals.finished.emit(self.label, self.token, qt_image.scaled(300, 300, QtCore.Qt.KeepAspectRatio))
 
 class StyleTransferApp(QWidget):
     def __init__(self):
         super().__init__()
         self.content_image = None
         self.style_image = None
+        self.content_preview = None
+        self.style_preview = None
         self.result_image = None
         self.styled_image = None
+        self.style_cdfs = None
+        self._styled_cache = {}
+        self._display_buf = None
+        self._blend_buf = None
+        self._work_bufs = {}
+        self._display_token = 0
+        self._display_tokens = {}
+        # One worker thread keeps conversions in order and lets them share the display buffer
+        self._display_pool = QThreadPool(self)
+        self._display_pool.setMaxThreadCount(1)
+        self._display_signals = _DisplaySignals()
+        self._display_signals.finished.connect(self._on_image_ready)
         self.intensity = 1.0
         self.transfer_method = "histogram"
+        self._preview_scale = 600
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.apply_intensity_blend)
@@ -281,9 +505,14 @@ class StyleTransferApp(QWidget):
         content_path, _ = QFileDialog.getOpenFileName(self, 'Open Content Image', '', 'Image Files (*.png *.jpg *.jpeg *.bmp *.tif *.tiff);;All Files (*)')
         if content_path:
             try:
-                self.content_image = load_image(content_path)
-                self.show_image(self.content_image, self.content_label)
-                self.show_conversion_info("content", content_path)
+                self.content_image, original_shape = load_image(content_path)
+                self.content_preview = downscale_for_preview(self.content_image, self._preview_scale)
+                self._styled_cache.clear()
+                self._display_buf = np.empty(self.content_preview.shape, dtype=np.uint8)
+                self._blend_buf = np.empty(self.content_preview.shape, dtype=np.float32)
+                self._work_bufs.clear()
+                self.show_image(self.content_preview, self.content_label)
+                self.show_conversion_info("content", original_shape)
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load content image: {str(e)}")
 
@@ -291,24 +520,23 @@ class StyleTransferApp(QWidget):
         style_path, _ = QFileDialog.getOpenFileName(self, 'Open Style Image', '', 'Image Files (*.png *.jpg *.jpeg *.bmp *.tif *.tiff);;All Files (*)')
         if style_path:
             try:
-                self.style_image = load_image(style_path)
-                self.show_image(self.style_image, self.style_label)
-                self.show_conversion_info("style", style_path)
+                self.style_image, original_shape = load_image(style_path)
+                self.style_preview = downscale_for_preview(self.style_image, self._preview_scale)
+                self.style_cdfs = _precompute_style_lut(self.style_image)
+                self._styled_cache.clear()
+                self.show_image(self.style_preview, self.style_label)
+                self.show_conversion_info("style", original_shape)
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load style image: {str(e)}")
 
-    def show_conversion_info(self, image_type, path):
+    def show_conversion_info(self, image_type, original_shape):
         """Show information about any image conversions that occurred."""
-        try:
-            original_img = img_as_float(io.imread(path))
-            if original_img.ndim == 2:
-                QtWidgets.QMessageBox.information(self, "Image Conversion", 
-                    f"Grayscale {image_type} image automatically converted to RGB for processing.")
-            elif original_img.ndim == 3 and original_img.shape[2] == 4:
-                QtWidgets.QMessageBox.information(self, "Image Conversion", 
-                    f"{image_type.title()} image with transparency (alpha channel) detected.\nAlpha channel removed for processing.")
-        except:
-            pass
+        if len(original_shape) == 2:
+            QtWidgets.QMessageBox.information(self, "Image Conversion", 
+                f"Grayscale {image_type} image automatically converted to RGB for processing.")
+        elif len(original_shape) == 3 and original_shape[2] == 4:
+            QtWidgets.QMessageBox.information(self, "Image Conversion", 
+                f"{image_type.title()} image with transparency (alpha channel) detected.\nAlpha channel removed for processing.")
 
     def update_intensity(self, value):
         self.intensity = value / 100.0
@@ -318,8 +546,8 @@ class StyleTransferApp(QWidget):
     
     def apply_intensity_blend(self):
         if self.content_image is not None and self.styled_image is not None:
-            self.result_image = blend_images(self.content_image, self.styled_image, self.intensity)
-            self.show_image(self.result_image, self.result_label)
+            self.result_image = blend_images(self.content_preview, self.styled_image, self.intensity, out=self._blend_buf)
+            self.show_image(self.result_image, self.result_label, self._display_buf)
     
     def on_method_changed(self, index):
         self.transfer_method = self.method_combo.itemData(index)
@@ -329,37 +557,69 @@ class StyleTransferApp(QWidget):
     def apply_style_transfer(self):
         if self.content_image is not None and self.style_image is not None:
             try:
-                if self.transfer_method == "histogram":
-                    self.styled_image = match_histograms_multichannel(self.content_image, self.style_image)
-                elif self.transfer_method == "meanstd":
-                    self.styled_image = color_transfer_meanstd(self.content_image, self.style_image)
-                elif self.transfer_method == "lut_linear":
-                    self.styled_image = lut_transfer_with_curve(self.content_image, self.style_image, 'linear')
-                elif self.transfer_method == "lut_scurve":
-                    self.styled_image = lut_transfer_with_curve(self.content_image, self.style_image, 's-curve')
-                elif self.transfer_method == "lut_contrast":
-                    self.styled_image = lut_transfer_with_curve(self.content_image, self.style_image, 'contrast')
-                elif self.transfer_method == "selective_shadows":
-                    self.styled_image = selective_color_transfer(self.content_image, self.style_image, 'shadows')
-                elif self.transfer_method == "selective_midtones":
-                    self.styled_image = selective_color_transfer(self.content_image, self.style_image, 'midtones')
-                elif self.transfer_method == "selective_highlights":
-                    self.styled_image = selective_color_transfer(self.content_image, self.style_image, 'highlights')
-                else:
-                    self.styled_image = match_histograms_multichannel(self.content_image, self.style_image)
-                
-                self.result_image = blend_images(self.content_image, self.styled_image, self.intensity)
-                self.show_image(self.result_image, self.result_label)
+                # Interactive display works on the downscaled previews; save_result redoes it at full size
+                self.styled_image = self._cached_transfer(self.content_preview, self.style_preview, self._work_buffer())
+                self.result_image = blend_images(self.content_preview, self.styled_image, self.intensity, out=self._blend_buf)
+                self.show_image(self.result_image, self.result_label, self._display_buf)
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "Error", f"Failed to apply style transfer: {str(e)}")
         else:
             QtWidgets.QMessageBox.warning(self, "Missing Images", "Please load both content and style images before applying style transfer.")
 
+    def _work_buffer(self):
+        """Return the preview-sized output buffer reserved for the current method.
+        
+        Buffers survive style reloads, so re-running a method writes into memory that
+        already exists; each one backs at most one entry of the styled cache.
+        """
+        buf = self._work_bufs.get(self.transfer_method)
+        if buf is None:
+            buf = np.empty(self.content_preview.shape, dtype=np.float32)
+            self._work_bufs[self.transfer_method] = buf
+        return buf
+
+    def _cached_transfer(self, content, style, out=None):
+        key = (id(content), id(style), self.transfer_method)
+        styled = self._styled_cache.get(key)
+        if styled is None:
+            styled = self._run_transfer(content, style, out)
+            self._styled_cache[key] = styled
+        return styled
+
+    def _run_transfer(self, content, style, out=None):
+        cdfs = self.style_cdfs
+        if self.transfer_method == "histogram":
+            return match_histograms_multichannel(content, style, cdfs, out=out)
+        elif self.transfer_method == "meanstd":
+            return color_transfer_meanstd(content, style, out=out)
+        elif self.transfer_method == "lut_linear":
+            return lut_transfer_with_curve(content, style, 'linear', cdfs, out=out)
+        elif self.transfer_method == "lut_scurve":
+            return lut_transfer_with_curve(content, style, 's-curve', cdfs, out=out)
+        elif self.transfer_method == "lut_contrast":
+            return lut_transfer_with_curve(content, style, 'contrast', cdfs, out=out)
+        elif self.transfer_method == "selective_shadows":
+            return selective_color_transfer(content, style, 'shadows', reference_cdfs=cdfs, out=out)
+        elif self.transfer_method == "selective_midtones":
+            return selective_color_transfer(content, style, 'midtones', reference_cdfs=cdfs, out=out)
+        elif self.transfer_method == "selective_highlights":
+            return selective_color_transfer(content, style, 'highlights', reference_cdfs=cdfs, out=out)
+        else:
+            return match_histograms_multichannel(content, style, cdfs, out=out)
+
     def clear_images(self):
         self.content_image = None
         self.style_image = None
+        self.content_preview = None
+        self.style_preview = None
         self.result_image = None
         self.styled_image = None
+        self.style_cdfs = None
+        self._styled_cache.clear()
+        self._display_buf = None
+        self._blend_buf = None
+        self._work_bufs.clear()
+        self._display_tokens.clear()
         
         for label in [self.content_label, self.style_label, self.result_label]:
             label.clear()
@@ -371,28 +631,39 @@ class StyleTransferApp(QWidget):
             file_types = "PNG Files (*.png);;JPEG Files (*.jpg);;TIFF Files(*.tiff);;BMP Files (*.bmp);;All Files (*.*)"
             save_path, _ = QFileDialog.getSaveFileName(self, 'Save Result Image', 'Untitled', file_types, options=options)
             if save_path:
-                save_image = (np.clip(self.result_image, 0, 1) * 255).astype(np.uint8)
+                styled_full = self._cached_transfer(self.content_image, self.style_image)
+                result_full = blend_images(self.content_image, styled_full, self.intensity)
+                save_image = np.empty(result_full.shape, dtype=np.uint8)
+                _to_u8(result_full, save_image)
                 io.imsave(save_path, save_image)
                 QtWidgets.QMessageBox.information(self, "Save Image", f"Image successfully saved to: {save_path}")
         else:
             QtWidgets.QMessageBox.warning(self, "No Image", "No result image to save. Please apply the style transfer first.")
 
-    def show_image(self, img_array, label):
-        img_array = np.clip(img_array, 0, 1)
-        img_array = (img_array * 255).astype(np.uint8)
-        
+    def show_image(self, img_array, label, buf=None):
         if img_array.ndim == 2:
-            h, w = img_array.shape
-            bytes_per_line = w
-            qt_image = QImage(img_array.data, w, h, bytes_per_line, QImage.Format_Grayscale8)
+            img_array = img_array[:, :, None]
+            image_format = QImage.Format_Grayscale8
         elif img_array.ndim == 3 and img_array.shape[2] == 3:
-            h, w, ch = img_array.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(img_array.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            image_format = QImage.Format_RGB888
         else:
             raise ValueError(f"Unsupported image format for display: {img_array.shape}")
-            
-        label.setPixmap(QPixmap.fromImage(qt_image).scaled(300, 300, QtCore.Qt.KeepAspectRatio))
+        
+        # The uint8 buffer is C-contiguous as QImage requires, so broadcast or sliced inputs
+        # are materialized there exactly once
+        if buf is None or buf.shape != img_array.shape:
+            buf = np.empty(img_array.shape, dtype=np.uint8)
+        
+        self._display_token += 1
+        self._display_tokens[label] = self._display_token
+        self._display_pool.start(_DisplayWorker(img_array, buf, image_format, label, self._display_token,
+                                                self._display_tokens, self._display_signals))
+
+    def _on_image_ready(self, label, token, qt_image):
+        # Runs on the GUI thread after any handler that rewrote the source array has
+        # bumped the token, so frames converted from a half-updated buffer are dropped here
+        if self._display_tokens.get(label) == token:
+            label.setPixmap(QPixmap.fromImage(qt_image))
 
 def main():
     app = QApplication(sys.argv)